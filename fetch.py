@@ -1,35 +1,236 @@
 from __future__ import annotations
 
-import feedparser
+import html
+import io
 import json
+import os
 import re
+import tempfile
+import textwrap
+import time
+import urllib.error
+import urllib.request
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from datetime import date
-from bs4 import BeautifulSoup
+from xml.etree import ElementTree as ET
+from selectolax.lexbor import LexborHTMLParser
+
+try:
+    import orjson  # optional: faster JSON encoding
+except ImportError:
+    orjson = None
 
 FEED_URL = "https://bible.usccb.org/lecturas.rss"
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "auto-lectio"
+
+# Patterns used on every header/body; compiled once at import time.
+_RE_HDR = re.compile(
+    r"^(Primera Lectura|Segunda Lectura|Salmo Responsorial|Aclamación antes del Evangelio|Evangelio)"
+    r"\s*(?:(\d)\s+)?([^\d,·—\-\u2013\u2014]*)",
+    re.I,
+)
+_RE_NONDIGIT = re.compile(r"^([^\d]+)")
+_RE_BIBREF = re.compile(r"([A-Za-zÁÉÍÓÚÜÑáéíóúüñ]+)\s+(\d{1,3})\s*[,.:]\s*([\d\-–, ]+)")
+_RE_COLLAPSE_BLANKS = re.compile(r"\n{3,}")
+_RE_EOL = re.compile(r"\r\n?")
+_RE_TRAIL_WS = re.compile(r"[^\S\n]+\n")
+# Sentence boundary: terminal punctuation + whitespace + a likely sentence
+# start, except right after a known abbreviation (add more as you discover them).
+_ABBR = r"(?<!\bSr\.)(?<!\bSra\.)(?<!\bDr\.)(?<!\bDra\.)(?<!\bp\.ej\.)(?<!\betc\.)"
+_RE_SENT_SPLIT = re.compile(rf"(?<=[.!?…]){_ABBR}\s+(?=[\"“¿¡A-ZÁÉÍÓÚÜÑ])")
+_RE_CLAUSE = re.compile(r"(?<=[,;:])\s+")
+_RE_PSALM_HDR = re.compile(r"^Salmo\s+Responsorial\s+", re.I)
+_RE_LINK_DATE = re.compile(r"(\d{6})")
+
+# Feed descriptions are a flat run of <h4> header / <div class="poetry"> body
+# pairs, so a regex pass is enough; the DOM parser is only the fallback.
+_PAIR_RE = re.compile(
+    r'<h4[^>]*>((?:(?!</?h4\b).)*?)</h4>(?:(?!<h4\b).)*?<div[^>]*\bclass="[^"]*\bpoetry\b[^"]*"[^>]*>(.*?)</div>',
+    re.DOTALL | re.I,
+)
+_RE_H4 = re.compile(r"<h4\b", re.I)
+_RE_DIV_OPEN = re.compile(r"<div\b", re.I)
+_RE_PARA = re.compile(r"<p\b[^>]*>(.*?)</p\s*>", re.DOTALL | re.I)
+_RE_BR = re.compile(r"<br\s*/?>", re.I)
+_RE_TAG = re.compile(r"<[^>]+>")
+
+_RE_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write data to a temp file beside path, then rename it into place."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def fetch_feed(url: str = FEED_URL, cache_dir: Optional[Path] = CACHE_DIR, refresh: bool = False) -> bytes:
+    """Download the raw RSS body, reusing an on-disk copy when the server allows it.
+
+    The cached body is served without a request while Cache-Control max-age
+    says it is fresh; otherwise it is revalidated with ETag/Last-Modified and
+    reused on 304. refresh=True downloads unconditionally but still stores the
+    new body; cache_dir=None bypasses the cache entirely. Cache writes are
+    best-effort: an unwritable cache dir never fails a successful download.
+    """
+    body_path = meta_path = None
+    meta: Dict = {}
+    if cache_dir is not None:
+        body_path = cache_dir / "usccb.rss"
+        meta_path = cache_dir / "usccb.rss.json"
+    if cache_dir is not None and not refresh:
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if meta.get("url") != url or not body_path.exists():
+                meta = {}
+        except (OSError, ValueError):
+            meta = {}
+        if meta and time.time() < meta.get("expires", 0):
+            return body_path.read_bytes()
+
+    req = urllib.request.Request(url, headers={"User-Agent": "auto-lectio"})
+    if meta.get("etag"):
+        req.add_header("If-None-Match", meta["etag"])
+    if meta.get("last_modified"):
+        req.add_header("If-Modified-Since", meta["last_modified"])
+    not_modified = False
+    try:
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            body = resp.read()
+            headers = resp.headers
+    except urllib.error.HTTPError as e:
+        if e.code != 304 or not meta:
+            raise
+        body = body_path.read_bytes()
+        headers = e.headers
+        not_modified = True
+
+    if cache_dir is not None:
+        m = _RE_MAX_AGE.search(headers.get("Cache-Control") or "")
+        meta = {
+            "url": url,
+            "etag": headers.get("ETag") or meta.get("etag"),
+            "last_modified": headers.get("Last-Modified") or meta.get("last_modified"),
+            "expires": time.time() + int(m.group(1)) if m else 0,
+        }
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # body first, so metadata never points at a partial body
+            if not not_modified:
+                _write_atomic(body_path, body)
+            _write_atomic(meta_path, (json.dumps(meta, indent=2) + "\n").encode("utf-8"))
+        except OSError:
+            pass
+    return body
 
 
 def mmddyy(d: date) -> str:
     return d.strftime("%m%d%y")
 
-def pick_item(entries, target_mmddyy: str):
-    for e in entries:
-        if target_mmddyy in e.link:   # robust enough for this feed
-            return e
+@dataclass
+class FeedItem:
+    title: str
+    link: str
+    description: str
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _iter_item_elements(body: bytes) -> Iterator[ET.Element]:
+    """Stream <item> elements out of the RSS body, freeing each one afterwards."""
+    for _, el in ET.iterparse(io.BytesIO(body), events=("end",)):
+        if _local(el.tag) == "item":
+            yield el
+            el.clear()
+
+
+def _item_field(el: ET.Element, name: str) -> str:
+    for child in el:
+        if _local(child.tag) == name:
+            return child.text or ""
+    return ""
+
+
+def _to_feed_item(el: ET.Element) -> FeedItem:
+    return FeedItem(
+        title=_item_field(el, "title").strip(),
+        link=_item_field(el, "link").strip(),
+        description=_item_field(el, "description"),
+    )
+
+
+def iter_items(body: bytes) -> Iterator[FeedItem]:
+    for el in _iter_item_elements(body):
+        yield _to_feed_item(el)
+
+
+def find_item(body: bytes, target_mmddyy: str) -> Optional[FeedItem]:
+    """Return the first item whose link carries the date token; stops parsing there."""
+    for el in _iter_item_elements(body):
+        m = _RE_LINK_DATE.search(_item_field(el, "link"))
+        if m and m.group(1) == target_mmddyy:
+            return _to_feed_item(el)
     return None
 
+
+def index_entries(entries) -> Dict[str, object]:
+    """Map the mmddyy token in each item link to its entry (first one wins)."""
+    idx: Dict[str, object] = {}
+    for e in entries:
+        m = _RE_LINK_DATE.search(e.link)
+        if m:
+            idx.setdefault(m.group(1), e)
+    return idx
+
 def parse_sections(desc_html: str) -> list[tuple[str, str]]:
-    soup = BeautifulSoup(desc_html, "html.parser")
+    pairs = _PAIR_RE.findall(desc_html)
+    # The regex is only trusted on the flat layout: one poetry div per <h4>,
+    # no nested <div>, and every body yielding text (an unclosed <p> gives
+    # none). Anything else, e.g. a header without a body, goes to the DOM.
+    if pairs and len(pairs) == len(_RE_H4.findall(desc_html)) and not any(
+        _RE_DIV_OPEN.search(body) for _, body in pairs
+    ):
+        sections = [(_strip_tags(header), _div_body_to_text(body)) for header, body in pairs]
+        if all(body for _, body in sections):
+            return sections
+    # unexpected markup: let the HTML parser sort it out
+    return parse_sections_dom(desc_html)
+
+def _strip_tags(fragment: str) -> str:
+    txt = html.unescape(_RE_TAG.sub(" ", fragment))
+    return " ".join(txt.split())
+
+def _div_body_to_text(body_html: str) -> str:
+    paras = []
+    for inner in _RE_PARA.findall(body_html):
+        txt = html.unescape(_RE_TAG.sub("", _RE_BR.sub("\n", inner)))
+        lines = [ln.strip() for ln in txt.splitlines() if ln.strip()]
+        if lines:
+            paras.append("\n".join(lines))
+    return "\n\n".join(paras).strip()
+
+def parse_sections_dom(desc_html: str) -> list[tuple[str, str]]:
+    tree = LexborHTMLParser(desc_html)
     sections: list[tuple[str, str,]] = []
 
-    for h4 in soup.find_all("h4"):
-        header = h4.get_text(" ", strip=True)
-        div = h4.find_next_sibling(lambda tag: tag and tag.name == "div" and "poetry" in tag.get("class", []))
-        if not div:
+    for h4 in tree.css("h4"):
+        header = h4.text(separator=" ", strip=True)
+        div = next_poetry_div(h4)
+        if div is None:
             continue
 
         body = div_to_text(div)
@@ -37,14 +238,32 @@ def parse_sections(desc_html: str) -> list[tuple[str, str]]:
 
     return sections
 
+def next_poetry_div(node):
+    """Return the first following sibling <div class="poetry">, if any."""
+    sib = node.next
+    while sib is not None:
+        if sib.tag == "div" and "poetry" in (sib.attributes.get("class") or "").split():
+            return sib
+        sib = sib.next
+    return None
+
 def div_to_text(div) -> str:
+    # one walk collects both; <br> is swapped afterwards so the tree
+    # is not mutated mid-traversal
+    brs, ps = [], []
+    for node in div.traverse():
+        if node.tag == "br":
+            brs.append(node)
+        elif node.tag == "p":
+            ps.append(node)
+
     # convert <br> to newlines
-    for br in div.find_all("br"):
+    for br in brs:
         br.replace_with("\n")
 
     paras = []
-    for p in div.find_all("p"):
-        txt = p.get_text()
+    for p in ps:
+        txt = p.text()
         # normalize whitespace
         lines = [ln.strip() for ln in txt.splitlines() if ln.strip()]
         if lines:
@@ -58,19 +277,38 @@ def strip_footer(desc_html: str) -> str:
     i = desc_html.find(sep)
     return desc_html if i == -1 else desc_html[:i]
 
+HEADER_KINDS = {
+    "primera lectura": "FIRST",
+    "segunda lectura": "SECOND",
+    "salmo responsorial": "PSALM",
+    "aclamación antes del evangelio": "ACCLAMATION",
+    "evangelio": "GOSPEL",
+}
+
+
+@lru_cache(maxsize=256)
+def parse_header(header: str) -> tuple[str, Optional[str], str]:
+    """Split a section header into (kind, ordinal, book) with a single match.
+
+    Examples:
+      "Primera Lectura Sofonías 3, 1-2. 9-13" -> ("FIRST", None, "Sofonías")
+      "Segunda Lectura 1 Juan 3, 1-2" -> ("SECOND", "1", "Juan")
+      "Evangelio Mateo 21, 28-32" -> ("GOSPEL", None, "Mateo")
+    """
+    h = header.strip()
+    m = _RE_HDR.match(h)
+    if m:
+        kind, ord_num, book = HEADER_KINDS[m.group(1).lower()], m.group(2), m.group(3)
+    else:
+        # unknown category: keep up to before the first digit
+        nd = _RE_NONDIGIT.match(h)
+        kind, ord_num, book = "OTHER", None, nd.group(1) if nd else h
+    # normalize spacing
+    return kind, ord_num, " ".join(book.split()).strip(" ,·—-\u2013\u2014")
+
+
 def classify(header: str) -> str:
-    h = header.lower()
-    if h.startswith("primera lectura"):
-        return "FIRST"
-    if h.startswith("segunda lectura"):
-        return "SECOND"
-    if h.startswith("salmo responsorial"):
-        return "PSALM"
-    if h.startswith("aclamación antes del evangelio"):
-        return "ACCLAMATION"
-    if h.startswith("evangelio"):
-        return "GOSPEL"
-    return "OTHER"
+    return parse_header(header)[0]
 
 
 def extract_book_phrase(header: str) -> str:
@@ -78,28 +316,34 @@ def extract_book_phrase(header: str) -> str:
 
     Examples:
       "Primera Lectura Sofonías 3, 1-2. 9-13" -> "Sofonías"
+      "Segunda Lectura 1 Juan 3, 1-2" -> "Juan"
       "Evangelio Mateo 21, 28-32" -> "Mateo"
     """
-    h = header.strip()
-    # drop leading category words
-    h = re.sub(r"^(Primera Lectura|Segunda Lectura|Evangelio|Salmo Responsorial)\s+", "", h, flags=re.I)
-    # keep up to before the first digit
-    m = re.match(r"^([^\d]+)", h)
-    book = m.group(1) if m else h
-    # normalize spacing
-    return " ".join(book.split()).strip(" ,·—-\u2013\u2014")
+    return parse_header(header)[2]
 
 
-PROPHETS = {
+PROPHETS = frozenset({
     "Isaías", "Jeremías", "Ezequiel", "Daniel", "Oseas", "Joel", "Amós",
     "Abdías", "Jonás", "Miqueas", "Nahúm", "Habacuc", "Sofonías", "Ageo",
     "Zacarías", "Malaquías", "Baruc"
-}
+})
+
+# Books read with a feminine article ("Lectura del libro de la Sabiduría")
+FEM_BOOKS = frozenset({"Sabiduría"})
 
+# Article before numbered books as read in the lectionary
+# ("primer libro de los Reyes"), keyed by accent-folded name; Samuel takes none.
+NUMBERED_BOOK_ARTICLES = {"reyes": "los ", "macabeos": "los ", "cronicas": "las "}
 
+
+@lru_cache(maxsize=256)
 def first_reading_intro(header: str) -> str:
-    book = extract_book_phrase(header)
+    _, ord_num, book = parse_header(header)
     nbook = book.lower()
+    # Numbered books (1 Samuel, 2 Reyes, ...)
+    if ord_num in ("1", "2"):
+        article = NUMBERED_BOOK_ARTICLES.get(fold_accents(book), "")
+        return f"Lectura del {'primer' if ord_num == '1' else 'segundo'} libro de {article}{book}"
     # Prophets
     if book in PROPHETS:
         return f"Lectura del profeta {book}"
@@ -107,8 +351,7 @@ def first_reading_intro(header: str) -> str:
     if "hechos" in nbook:
         return "Lectura del libro de los Hechos de los Apóstoles"
     # Feminine article (Sabiduría)
-    fem_books = {"Sabiduría"}
-    if book in fem_books or nbook.startswith("la "):
+    if book in FEM_BOOKS or nbook.startswith("la "):
         return f"Lectura del libro de la {book.replace('la ', '').strip()}"
     return f"Lectura del libro de {book}"
 
@@ -137,7 +380,7 @@ def extract_bible_ref_from_text(text: str) -> Optional[str]:
     Returns a normalized string using colon between chapter and verse if possible.
     """
     # Common Spanish pattern: Book Chapter, Verses  e.g., "Mateo 21, 28-32"
-    m = re.search(r"([A-Za-zÁÉÍÓÚÜÑáéíóúüñ]+)\s+(\d{1,3})\s*[,.:]\s*([\d\-–, ]+)", text)
+    m = _RE_BIBREF.search(text)
     if not m:
         return None
     book, chap, verses = m.group(1), m.group(2), m.group(3)
@@ -146,6 +389,64 @@ def extract_bible_ref_from_text(text: str) -> Optional[str]:
     return f"{book} {chap}:{verses}"
 
 
+# crude accent normalization for matching, applied in one translate() pass
+_ACCENT_TT = str.maketrans({
+    "á": "a", "é": "e", "í": "i", "ó": "o", "ú": "u", "ü": "u", "ñ": "n",
+    "Á": "a", "É": "e", "Í": "i", "Ó": "o", "Ú": "u", "Ü": "u", "Ñ": "n",
+})
+
+
+def fold_accents(s: str) -> str:
+    return s.lower().translate(_ACCENT_TT)
+
+
+ORD_SPANISH = {"1": "primera", "2": "segunda", "3": "tercera"}
+
+# Apostle Paul letters to communities/persons, keyed by accent-folded name:
+# plurals take "a los ...", singulars take "a ..."
+PAULINE_PLURALS = {
+    "romanos": "Romanos",
+    "corintios": "Corintios",
+    "galatas": "Gálatas",
+    "filipenses": "Filipenses",
+    "colosenses": "Colosenses",
+    "tesalonicenses": "Tesalonicenses",
+    "efesios": "Efesios",
+}
+PAULINE_SINGULARS = {
+    "timoteo": "Timoteo",
+    "tito": "Tito",
+    "filemon": "Filemón",
+}
+
+
+def _build_second_intros() -> Dict[tuple[str, Optional[str]], str]:
+    """Every (accent-folded book, ordinal) -> intro string, computed at import."""
+    table: Dict[tuple[str, Optional[str]], str] = {}
+    for ord_num in (None, *ORD_SPANISH):
+        carta = f"{ORD_SPANISH[ord_num]} carta" if ord_num else "carta"
+        # Paul's letters only come as 1/2
+        pablo = carta if ord_num in ("1", "2") else "carta"
+        # Special cases not attributed to an apostle name
+        table["hebreos", ord_num] = "Lectura de la carta a los Hebreos"
+        table["apocalipsis", ord_num] = "Lectura del libro del Apocalipsis"
+        # Apostle John / Peter letters
+        table["juan", ord_num] = f"Lectura de la {carta} del apóstol san Juan"
+        table["pedro", ord_num] = f"Lectura de la {carta} del apóstol san Pedro"
+        for nb, name in PAULINE_PLURALS.items():
+            table[nb, ord_num] = f"Lectura de la {pablo} del apóstol san Pablo a los {name}"
+        for nb, name in PAULINE_SINGULARS.items():
+            table[nb, ord_num] = f"Lectura de la {pablo} del apóstol san Pablo a {name}"
+        # James (Santiago), Jude (Judas)
+        table["santiago", ord_num] = "Lectura de la carta del apóstol Santiago"
+        table["judas", ord_num] = "Lectura de la carta del apóstol Judas"
+    return table
+
+
+SECOND_INTROS = _build_second_intros()
+
+
+@lru_cache(maxsize=256)
 def second_reading_intro(header: str) -> str:
     """Format the Second Reading reference as said in Mass.
 
@@ -157,97 +458,27 @@ def second_reading_intro(header: str) -> str:
       Revelation -> "Lectura del libro del Apocalipsis"
       James (Santiago) -> "Lectura de la carta del apóstol Santiago"
     """
-    book_raw = extract_book_phrase(header)  # e.g., "Santiago", "1 Juan", "Romanos"
-    book = book_raw.strip()
-
-    # Split possible ordinal and base name: e.g., "1 Juan" -> ("1", "Juan")
-    import re
-    m = re.match(r"^(\d)\s+(.+)$", book)
-    ord_num = None
-    base = book
-    if m:
-        ord_num = m.group(1)
-        base = m.group(2).strip()
-
-    def ord_spanish(n: str) -> str:
-        return {"1": "primera", "2": "segunda", "3": "tercera"}.get(n, "")
-
-    def norm(s: str) -> str:
-        t = s.lower()
-        # crude accent normalization for matching
-        repl = {
-            "á": "a", "é": "e", "í": "i", "ó": "o", "ú": "u", "ü": "u", "ñ": "n",
-        }
-        for k, v in repl.items():
-            t = t.replace(k, v)
-        return t
-
-    nb = norm(base)
-
-    # Special cases not attributed to an apostle name
-    if nb == "hebreos":
-        return "Lectura de la carta a los Hebreos"
-    if nb == "apocalipsis":
-        return "Lectura del libro del Apocalipsis"
-
-    # Apostle John letters
-    if nb == "juan":
-        if ord_num:
-            return f"Lectura de la {ord_spanish(ord_num)} carta del apóstol san Juan"
-        return "Lectura de la carta del apóstol san Juan"
-
-    # Apostle Peter letters
-    if nb == "pedro":
-        if ord_num:
-            return f"Lectura de la {ord_spanish(ord_num)} carta del apóstol san Pedro"
-        return "Lectura de la carta del apóstol san Pedro"
-
-    # Apostle Paul letters to communities/persons
-    # Map Spanish plurals that take "a los ..." and singular "a ..."
-    pauline_plurals = {
-        "romanos": "Romanos",
-        "corintios": "Corintios",
-        "galatas": "Gálatas",
-        "filipenses": "Filipenses",
-        "colosenses": "Colosenses",
-        "tesalonicenses": "Tesalonicenses",
-        "efesios": "Efesios",
-    }
-    pauline_singulars = {
-        "timoteo": "Timoteo",
-        "tito": "Tito",
-        "filemon": "Filemón",
-    }
-    if nb in pauline_plurals:
-        if ord_num in ("1", "2"):
-            return f"Lectura de la {ord_spanish(ord_num)} carta del apóstol san Pablo a los {pauline_plurals[nb]}"
-        return f"Lectura de la carta del apóstol san Pablo a los {pauline_plurals[nb]}"
-    if nb in pauline_singulars:
-        if ord_num in ("1", "2"):
-            return f"Lectura de la {ord_spanish(ord_num)} carta del apóstol san Pablo a {pauline_singulars[nb]}"
-        return f"Lectura de la carta del apóstol san Pablo a {pauline_singulars[nb]}"
-
-    # James (Santiago), Jude (Judas), etc.
-    if nb == "santiago":
-        return "Lectura de la carta del apóstol Santiago"
-    if nb == "judas":
-        return "Lectura de la carta del apóstol Judas"
-
-    # Fallback: generic "Lectura de la carta de {Book}"
-    return f"Lectura de la carta de {base}"
+    # Ordinal and base name come split already: e.g., "1 Juan" -> ("1", "Juan")
+    _, ord_num, base = parse_header(header)
+    return SECOND_INTROS.get((fold_accents(base), ord_num)) or f"Lectura de la carta de {base}"
 
 def to_placeholders(item_title: str, sections: list[tuple[str, str]]) -> dict[str, str]:
-    ph = {"{LITURGICAL_DAY}": item_title}
+    """Map section headers/bodies onto template placeholders.
+
+    Values come out normalized (see normalize_text), ready for build_payload.
+    """
+    ph = {"{LITURGICAL_DAY}": normalize_text(item_title)}
 
     for header, body in sections:
         kind = classify(header)
+        body = normalize_text(body)
 
         if kind == "FIRST":
             ph["{FIRST_READING_REF}"] = first_reading_intro(header)
             ph["{FIRST_READING_TXT}"] = body
         elif kind == "PSALM":
             # Remove leading 'Salmo Responsorial' while keeping the psalm reference
-            ps_ref = re.sub(r"^Salmo\s+Responsorial\s+", "", header, flags=re.I).strip()
+            ps_ref = _RE_PSALM_HDR.sub("", header).strip()
             ph["{PSALM_REF}"] = ps_ref
             ph["{PSALM_TXT}"] = body
         elif kind == "SECOND":
@@ -267,48 +498,25 @@ def to_placeholders(item_title: str, sections: list[tuple[str, str]]) -> dict[st
 
 def normalize_text(s: str) -> str:
     # normalize line endings + trim trailing spaces on each line
-    s = s.replace("\r\n", "\n").replace("\r", "\n")
-    lines = [ln.rstrip() for ln in s.split("\n")]
+    s = _RE_EOL.sub("\n", s)
+    s = _RE_TRAIL_WS.sub("\n", s)
     # collapse 3+ blank lines to at most 2
-    out = "\n".join(lines)
-    out = re.sub(r"\n{3,}", "\n\n", out)
-    return out.strip()
+    s = _RE_COLLAPSE_BLANKS.sub("\n\n", s)
+    return s.strip()
 
 
 def split_sentences(text: str) -> List[str]:
     """
     Simple sentence splitter that works decently for Spanish.
     Avoids splitting on common abbreviations like 'Sr.', 'Sra.', 'p.ej.' etc.
-    You can improve this later if needed.
+    (see _ABBR). You can improve this later if needed.
     """
     text = text.strip()
     if not text:
         return []
 
-    # protect a few abbreviations (add more as you discover them)
-    protected = {
-        "Sr.": "Sr<dot>",
-        "Sra.": "Sra<dot>",
-        "Dr.": "Dr<dot>",
-        "Dra.": "Dra<dot>",
-        "p.ej.": "pej<dot>",
-        "etc.": "etc<dot>",
-    }
-    for k, v in protected.items():
-        text = text.replace(k, v)
-
     # split on punctuation followed by whitespace + a likely next sentence start
-    parts = re.split(r"(?<=[.!?…])\s+(?=[\"“¿¡A-ZÁÉÍÓÚÜÑ])", text)
-
-    # restore protected dots
-    restored: List[str] = []
-    for p in parts:
-        for k, v in protected.items():
-            p = p.replace(v, k)
-        p = p.strip()
-        if p:
-            restored.append(p)
-    return restored
+    return [p for p in (part.strip() for part in _RE_SENT_SPLIT.split(text)) if p]
 
 
 def chunkify(
@@ -329,51 +537,49 @@ def chunkify(
 
     sentences = split_sentences(text)
     chunks: List[str] = []
+    wrapper = textwrap.TextWrapper(width=max_chars, break_long_words=False, break_on_hyphens=False)
 
-    def push(buf: List[str]):
-        if not buf:
-            return
-        s = " ".join(buf).strip()
-        if s:
-            chunks.append(s)
-        buf.clear()
+    def push(buf: List[str]) -> None:
+        if buf:
+            chunks.append(" ".join(buf))
+            buf.clear()
 
+    # Each buffer tracks its joined length (items + separating spaces) so
+    # fit checks never have to rebuild the candidate string.
     buf: List[str] = []
+    buf_len = 0
 
     for sent in sentences:
-        candidate = (" ".join(buf + [sent])).strip()
-        if len(candidate) <= max_chars:
+        new_len = buf_len + len(sent) + (1 if buf else 0)
+        if new_len <= max_chars:
             buf.append(sent)
+            buf_len = new_len
             continue
 
         # flush current buffer
         push(buf)
+        buf_len = 0
 
         if len(sent) <= max_chars:
             buf.append(sent)
+            buf_len = len(sent)
             continue
 
         # Split long sentence by clauses (commas/semicolons/colons)
-        clauses = [c.strip() for c in re.split(r"(?<=[,;:])\s+", sent) if c.strip()]
+        clauses = [c.strip() for c in _RE_CLAUSE.split(sent) if c.strip()]
         clause_buf: List[str] = []
+        clause_len = 0
         for cl in clauses:
-            cand2 = (" ".join(clause_buf + [cl])).strip()
-            if len(cand2) <= max_chars:
+            new_len = clause_len + len(cl) + (1 if clause_buf else 0)
+            if new_len <= max_chars:
                 clause_buf.append(cl)
+                clause_len = new_len
             else:
                 # flush clause buffer
                 push(clause_buf)
-                # hard-wrap this clause by words
-                words = cl.split()
-                wbuf: List[str] = []
-                for w in words:
-                    candw = (" ".join(wbuf + [w])).strip()
-                    if len(candw) <= max_chars:
-                        wbuf.append(w)
-                    else:
-                        push(wbuf)
-                        wbuf = [w]
-                push(wbuf)
+                clause_len = 0
+                # hard-wrap this clause by words (words longer than max stay whole)
+                chunks.extend(wrapper.wrap(" ".join(cl.split())))
         push(clause_buf)
 
     push(buf)
@@ -397,6 +603,11 @@ def build_payload(
     placeholders: Dict[str, str],
     chunks: Optional[Dict[str, List[str]]] = None,
 ) -> Dict:
+    """Assemble the JSON payload.
+
+    placeholders/chunks are stored as given; to_placeholders and chunkify
+    already return normalized text.
+    """
     payload = {
         "meta": {
             "date": d.isoformat(),
@@ -405,20 +616,22 @@ def build_payload(
             "link": link,
             "title": title,
         },
-        "placeholders": {k: normalize_text(v) for k, v in placeholders.items()},
+        "placeholders": placeholders,
     }
     if chunks:
-        payload["chunks"] = {k: [normalize_text(x) for x in v] for k, v in chunks.items()}
+        payload["chunks"] = chunks
     return payload
 
 
 def write_payload_json(payload: Dict, out_path: str | Path) -> None:
     out_path = Path(out_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2) + "\n",
-        encoding="utf-8",
-    )
+    if orjson is not None:
+        out_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        return
+    with out_path.open("w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+        f.write("\n")
 
 def make_chunks(placeholders: Dict[str, str]) -> Dict[str, List[str]]:
     """
@@ -455,24 +668,12 @@ def parse_date_arg(s: str) -> date:
     raise ValueError(f"Unrecognized date format: {s}")
 
 
-def main() -> None:
-    import argparse
-    ap = argparse.ArgumentParser(description="Fetch USCCB RSS item and build JSON payload.")
-    ap.add_argument("--date", dest="date_str", help="Target date (YYYY-MM-DD or MM-DD-YY)")
-    ap.add_argument("--out", dest="out_path", help="Output JSON path (default: out/YYYY-MM-DD.es-US.json)")
-    args = ap.parse_args()
-
-    target_date = parse_date_arg(args.date_str) if args.date_str else date.today()
-
-    parsed = feedparser.parse(FEED_URL)
-    entries = parsed.entries
-
-    dt_key = mmddyy(target_date)
+def default_out_path(d: date) -> Path:
+    return Path("out") / f"{d.isoformat()}.es-US.json"
 
-    item = pick_item(entries, dt_key)
-    if item is None:
-        raise RuntimeError(f"No RSS item found for {dt_key}")
 
+def process_one(target_date: date, item: FeedItem, out_path: Path) -> tuple[int, Dict[str, List[str]]]:
+    """Build and write the payload for one feed item; returns (section count, chunks)."""
     # parse readings from description html
     cleaned = strip_footer(item.description)
     sections = parse_sections(cleaned)
@@ -492,16 +693,49 @@ def main() -> None:
         placeholders=placeholders,
         chunks=chunks,
     )
-
-    default_out = Path("out") / f"{target_date.isoformat()}.es-US.json"
-    out_path = Path(args.out_path) if args.out_path else default_out
     write_payload_json(payload, out_path)
+    return len(sections), chunks
+
+
+def main() -> None:
+    import argparse
+    from concurrent.futures import ThreadPoolExecutor
+
+    ap = argparse.ArgumentParser(description="Fetch USCCB RSS item(s) and build JSON payload(s).")
+    which = ap.add_mutually_exclusive_group()
+    which.add_argument("--date", dest="date_str", help="Target date (YYYY-MM-DD or MM-DD-YY)")
+    which.add_argument("--dates", nargs="+", help="Several target dates; one payload each, feed fetched once")
+    ap.add_argument("--out", dest="out_path", help="Output JSON path (default: out/YYYY-MM-DD.es-US.json)")
+    ap.add_argument("--no-cache", action="store_true", help=f"Always download the feed (refreshes {CACHE_DIR})")
+    args = ap.parse_args()
 
-    print(f"wrote: {out_path}")
-    print(f"title: {item.title}")
-    print(f"sections: {len(sections)}")
-    for k, v in chunks.items():
-        print(f"{k}: {len(v)} chunks")
+    date_strs = args.dates or ([args.date_str] if args.date_str else [])
+    # repeated dates would have two workers writing the same payload file
+    targets = list(dict.fromkeys(parse_date_arg(s) for s in date_strs)) or [date.today()]
+    if args.out_path and len(targets) > 1:
+        ap.error("--out only applies to a single date")
+
+    body = fetch_feed(FEED_URL, CACHE_DIR, refresh=args.no_cache)
+
+    if len(targets) == 1:
+        items = [find_item(body, mmddyy(targets[0]))]
+    else:
+        idx = index_entries(iter_items(body))
+        items = [idx.get(mmddyy(d)) for d in targets]
+    missing = [mmddyy(d) for d, item in zip(targets, items) if item is None]
+    if missing:
+        raise RuntimeError(f"No RSS item found for {', '.join(missing)}")
+
+    out_paths = [Path(args.out_path) if args.out_path else default_out_path(d) for d in targets]
+    with ThreadPoolExecutor(max_workers=min(8, len(targets))) as ex:
+        results = list(ex.map(process_one, targets, items, out_paths))
+
+    for item, out_path, (n_sections, chunks) in zip(items, out_paths, results):
+        print(f"wrote: {out_path}")
+        print(f"title: {item.title}")
+        print(f"sections: {n_sections}")
+        for k, v in chunks.items():
+            print(f"{k}: {len(v)} chunks")
 
 
 if __name__ == "__main__":
@@ -2,83 +2,190 @@ from __future__ import annotations
 
 import argparse
 import os
+import re
 from datetime import datetime
 import json
-from copy import deepcopy
+import logging
+import sys
+from functools import lru_cache
+from copy import copy as _clone_element  # lxml: __copy__ is a full C-level subtree clone
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
 
+logger = logging.getLogger("render")
 
-# Simple iterator that also descends into group shapes (type 6)
+
+# Iterator that also descends into (nested) group shapes, in document order
 def iter_shapes(slide):
-    for shape in slide.shapes:
+    # list() then reverse in place: reversed() on a shapes collection falls
+    # back to __getitem__, which rebuilds the member list per index (O(K^2))
+    stack = list(slide.shapes)
+    stack.reverse()
+    while stack:
+        shape = stack.pop()
         yield shape
-        # 6 == MSO_SHAPE_TYPE.GROUP
-        if getattr(shape, "shape_type", None) == 6 and hasattr(shape, "shapes"):
-            for s in shape.shapes:
-                yield s
-
-
-def _replace_in_text_frame(tf, token: str, new_text: str) -> bool:
-    replaced = False
-    for p in tf.paragraphs:
-        for run in p.runs:
-            if token in run.text:
-                run.text = run.text.replace(token, new_text)
-                replaced = True
-    return replaced
-
-
-def replace_token_in_shape(shape, token: str, new_text: str) -> bool:
-    """Replace token in a single shape (text frame or table cells)."""
-    replaced = False
-    if getattr(shape, "has_text_frame", False):
-        if _replace_in_text_frame(shape.text_frame, token, new_text):
-            replaced = True
-    # Tables
-    if getattr(shape, "has_table", False):
-        tbl = shape.table
-        for row in tbl.rows:
-            for cell in row.cells:
-                if _replace_in_text_frame(cell.text_frame, token, new_text):
-                    replaced = True
-    return replaced
-
-
-def replace_tokens_in_slide(slide, mapping: Dict[str, str]) -> int:
-    """Replace all tokens from mapping in the given slide. Returns count replaced."""
+        if getattr(shape, "shape_type", None) == MSO_SHAPE_TYPE.GROUP:
+            children = list(shape.shapes)
+            children.reverse()
+            stack.extend(children)
+
+
+# Per-slide [(shape, text_frames, has_brace)] resolved once and reused across
+# passes. has_brace says whether any frame text contains "{" (every placeholder
+# token starts with one), so token passes can skip decorative shapes.
+# Keyed by slide part: Slide wrappers are rebuilt on every prs.slides access,
+# the part is not. Call invalidate_shape_cache() after adding/removing shapes.
+_SHAPE_CACHE: Dict[object, List[Tuple[object, List[object], bool]]] = {}
+
+
+def _frames_have_brace(frames) -> bool:
+    return any("{" in tf.text for tf in frames)
+
+
+def slide_shape_entries(slide) -> List[Tuple[object, List[object], bool]]:
+    entries = _SHAPE_CACHE.get(slide.part)
+    if entries is None:
+        entries = []
+        for shape in iter_shapes(slide):
+            frames = []
+            if getattr(shape, "has_text_frame", False):
+                frames.append(shape.text_frame)
+            if getattr(shape, "has_table", False):
+                for row in shape.table.rows:
+                    for cell in row.cells:
+                        frames.append(cell.text_frame)
+            entries.append((shape, frames, _frames_have_brace(frames)))
+        _SHAPE_CACHE[slide.part] = entries
+    return entries
+
+
+def invalidate_shape_cache(slide) -> None:
+    _SHAPE_CACHE.pop(slide.part, None)
+
+
+def _replace_across_runs(runs, token: str, new_text: str) -> bool:
+    """Replace a token that PowerPoint split across several runs.
+
+    The replacement lands in the first run touched by the token (keeping
+    its formatting); the rest of the token's runs are trimmed.
+    """
+    texts = [r.text for r in runs]
+    full = "".join(texts)
+    start = full.find(token)
+    if start < 0:
+        return False
+    end = start + len(token)
+    offset = 0
+    first = None
+    for run, txt in zip(runs, texts):
+        r_start, r_end = offset, offset + len(txt)
+        offset = r_end
+        if r_end <= start or r_start >= end:
+            continue
+        if first is None:
+            first = run
+            head = txt[:start - r_start]
+        if r_end >= end:
+            tail = txt[end - r_start:]
+            if run is first:
+                first.text = head + new_text + tail
+            else:
+                first.text = head + new_text
+                run.text = tail
+            break
+        if run is not first:
+            run.text = ""
+    return True
+
+
+def token_pattern(tokens: Iterable[str]) -> re.Pattern:
+    """Compile one alternation over all tokens so a text is scanned once for all of them."""
+    return re.compile("|".join(re.escape(t) for t in sorted(tokens, key=len, reverse=True)))
+
+
+def replace_tokens_in_slide(slide, mapping: Dict[str, str], pattern: Optional[re.Pattern] = None) -> int:
+    """Replace all tokens from mapping in the given slide. Returns count replaced.
+
+    pattern should be token_pattern(mapping); pass it in when reusing one mapping
+    across many slides.
+    """
+    if not mapping:
+        return 0
+    if pattern is None:
+        pattern = token_pattern(mapping)
+    braced = all(k.startswith("{") for k in mapping)
     count = 0
-    for shape in iter_shapes(slide):
-        for token, val in mapping.items():
-            if replace_token_in_shape(shape, token, val):
-                count += 1
+    entries = slide_shape_entries(slide)
+    for i, (shape, frames, has_brace) in enumerate(entries):
+        if braced and not has_brace:
+            continue
+        hits: set[str] = set()
+        wrote = False
+
+        def sub(m: re.Match) -> str:
+            hits.add(m.group(0))
+            return mapping[m.group(0)]
+
+        for tf in frames:
+            for p in tf.paragraphs:
+                runs = p.runs
+                texts = []
+                for run in runs:
+                    # one read per run; search first so token-free runs never
+                    # build a new string or touch the <a:t> setter
+                    t = run.text
+                    if pattern.search(t) is not None:
+                        t = pattern.sub(sub, t)
+                        run.text = t
+                        wrote = True
+                    texts.append(t)
+                if len(runs) > 1:
+                    # tokens PowerPoint split across runs
+                    for token in pattern.findall("".join(texts)):
+                        if _replace_across_runs(runs, token, mapping[token]):
+                            hits.add(token)
+                            wrote = True
+        if wrote:
+            # the text changed: keep has_brace true to the new contents
+            entries[i] = (shape, frames, _frames_have_brace(frames))
+        count += len(hits)
     return count
 
 
+def slide_xml_text(slide) -> str:
+    """All text nodes of the slide XML, concatenated (cheap pre-filter).
+
+    Every shape's text is a run of these nodes, so a token missing here
+    cannot be in any shape; extra hits across shape boundaries are possible.
+    """
+    return "".join(slide._element.itertext())
+
+
 def slide_contains_token(slide, token: str) -> bool:
-    for shape in iter_shapes(slide):
-        if getattr(shape, "has_text_frame", False) and token in shape.text_frame.text:
+    if token not in slide_xml_text(slide):
+        return False
+    braced = token.startswith("{")
+    for _, frames, has_brace in slide_shape_entries(slide):
+        if braced and not has_brace:
+            continue
+        if any(token in tf.text for tf in frames):
             return True
-        if getattr(shape, "has_table", False):
-            tbl = shape.table
-            for row in tbl.rows:
-                for cell in row.cells:
-                    if token in cell.text_frame.text:
-                        return True
     return False
 
 
+# Any whitespace run (newlines, tabs, NBSP, ...): same set str.split() uses
+_WS_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)  # pure; refrains and mapping values repeat across slides
 def _sanitize_text(s: str) -> str:
     if s is None:
         return ""
-    # Replace all newlines with spaces and collapse repeated whitespace
-    s = s.replace("\r\n", "\n").replace("\r", "\n")
-    s = s.replace("\n", " ")
-    # Collapse multiple spaces/tabs
-    s = " ".join(s.split())
-    return s.strip()
+    # Replace all newlines with spaces and collapse repeated whitespace, one pass
+    return _WS_RE.sub(" ", s).strip()
 
 
 def enforce_chunk_bounds(chunks: List[str], min_chars: int = 100, max_chars: int = 140) -> List[str]:
@@ -89,52 +196,108 @@ def enforce_chunk_bounds(chunks: List[str], min_chars: int = 100, max_chars: int
     - Operates on already-sanitized chunks (no newlines).
     """
     out: List[str] = []
+    append = out.append
     i = 0
     n = len(chunks)
     while i < n:
         cur = chunks[i]
+        cur_len = len(cur)
         # If current is short and there is a next, try to merge
-        if len(cur) < min_chars and i + 1 < n:
+        if i + 1 < n and cur_len < min_chars:
             nxt = chunks[i + 1]
             # Prefer to merge if it keeps us within max
-            if len(cur) + 1 + len(nxt) <= max_chars:
-                cur = (cur + " " + nxt).strip()
+            combined = cur_len + 1 + len(nxt)
+            if combined <= max_chars:
+                append((cur + " " + nxt).strip())
                 i += 2
-                out.append(cur)
                 continue
-        out.append(cur)
+        append(cur)
         i += 1
     return out
 
 
-def find_seed_slide_indices(prs: Presentation, token: str) -> List[int]:
+def slide_tokens(slide, pattern: re.Pattern) -> Set[str]:
+    """Tokens of pattern present on the slide, from one scan of its text."""
+    text = "\n".join(tf.text for _, frames, _ in slide_shape_entries(slide) for tf in frames)
+    return set(pattern.findall(text))
+
+
+def process_deck_once(
+    slides: List,
+    mapping: Dict[str, str],
+    pattern: re.Pattern,
+    scan_pattern: re.Pattern,
+    before=None,
+) -> Dict[int, Set[str]]:
+    """Single deck walk: index tokens of scan_pattern per slide, then apply mapping.
+
+    slides is list(prs.slides), materialized once by the caller.
+
+    The returned index reflects the slides *before* replacement.
+    before(index, slide, tokens), if given, runs on each slide ahead of its
+    replacement (used for the verbose 'before' snapshot).
+    """
+    index: Dict[int, Set[str]] = {}
+    for i, slide in enumerate(slides):
+        toks = slide_tokens(slide, scan_pattern)
+        index[i] = toks
+        if before is not None:
+            before(i, slide, toks)
+        replace_tokens_in_slide(slide, mapping, pattern)
+    return index
+
+
+def find_seed_slide_indices(prs: Presentation, token: str, index: Optional[Dict[int, Set[str]]] = None) -> List[int]:
+    if index is not None:
+        return [i for i, toks in sorted(index.items()) if token in toks]
     return [i for i, s in enumerate(prs.slides) if slide_contains_token(s, token)]
 
 
-def insert_slide_after(prs: Presentation, new_slide, insert_after_index: int) -> None:
-    """Move the specific slide (by part rel) to position right after insert_after_index."""
+def slide_rid_map(prs: Presentation) -> Dict[object, str]:
+    """Slide part -> presentation rel rId, built once; insert_slide_after keeps it current."""
+    return {rel._target: rel.rId for rel in prs.part.rels.values() if not rel.is_external}
+
+
+def insert_slide_after(
+    prs: Presentation,
+    new_slide,
+    insert_after_index: int,
+    rid_by_part: Optional[Dict[object, str]] = None,
+) -> None:
+    """Move the specific slide (by part rel) to position right after insert_after_index.
+
+    rid_by_part (from slide_rid_map) replaces the scan over every
+    presentation rel; the moved slide's rId is recorded in it.
+    """
     sldIdLst = prs.slides._sldIdLst
-    # Find relationship id for this slide
     target_part = new_slide.part
-    rId = None
-    for rel in prs.part.rels.values():
-        if getattr(rel, "_target", None) is target_part:
-            rId = rel.rId
-            break
-    if rId is None:
-        # Fallback to last element (best-effort)
-        new_id = sldIdLst[-1]
-        sldIdLst.remove(new_id)
-        sldIdLst.insert(insert_after_index + 1, new_id)
-        return
-    # Find the sldId element with that rId
     moving = None
-    for sldId in sldIdLst:
-        if sldId.rId == rId:
-            moving = sldId
-            break
-    if moving is None:
-        return
+    # Fast path: add_slide() appends, so a fresh slide is the last sldId
+    if len(sldIdLst) and prs.part.related_part(sldIdLst[-1].rId) is target_part:
+        moving = sldIdLst[-1]
+    else:
+        # Find relationship id for this slide
+        rId = rid_by_part.get(target_part) if rid_by_part is not None else None
+        if rId is None:
+            for rel in prs.part.rels.values():
+                if getattr(rel, "_target", None) is target_part:
+                    rId = rel.rId
+                    break
+        if rId is None:
+            # Fallback to last element (best-effort)
+            new_id = sldIdLst[-1]
+            sldIdLst.remove(new_id)
+            sldIdLst.insert(insert_after_index + 1, new_id)
+            return
+        # Find the sldId element with that rId
+        for sldId in sldIdLst:
+            if sldId.rId == rId:
+                moving = sldId
+                break
+        if moving is None:
+            return
+    if rid_by_part is not None:
+        rid_by_part[target_part] = moving.rId
     sldIdLst.remove(moving)
     sldIdLst.insert(insert_after_index + 1, moving)
 
@@ -157,54 +320,136 @@ def clear_shapes(slide) -> None:
     for shape in list(slide.shapes):
         el = shape._element
         el.getparent().remove(el)
+    invalidate_shape_cache(slide)
+
+
+_BLIP_TAG = '{http://schemas.openxmlformats.org/drawingml/2006/main}blip'
 
 
 def _shape_has_image_rel(shape) -> bool:
     try:
-        # detect any blip reference which would need a rel copy
-        blips = shape._element.xpath('.//a:blip', namespaces=shape._element.nsmap)
-        return bool(blips)
+        # detect any blip reference which would need a rel copy (plain tree
+        # walk, no XPath compile or nsmap lookup)
+        return next(shape._element.iter(_BLIP_TAG), None) is not None
     except Exception:
         return False
 
 
-def duplicate_slide_filtered(prs: Presentation, seed_index: int, current_key: str, known_tokens: set[str]) -> Tuple[int, object]:
-    """Duplicate a slide by copying only safe shapes to avoid repair prompts and stray placeholders.
+def seed_shape_meta(slide) -> List[Tuple[object, str, bool]]:
+    """(shape, text, has_image_rel) for every shape, probed once per seed."""
+    return [(shape, _shape_text(shape), _shape_has_image_rel(shape)) for shape in slide.shapes]
+
 
-    - Copies text shapes containing the current_key token.
-    - Copies shapes with no placeholder tokens in their text.
-    - Skips shapes that contain any other placeholder tokens.
-    - Skips shapes with image relationships to avoid missing rels/repair.
+def prepare_seed_template(
+    prs: Presentation,
+    seed_index: int,
+    current_key: str,
+    known_tokens: set[str],
+    known_pattern: Optional[re.Pattern] = None,
+) -> List[object]:
+    """Seed shape elements that duplicates should receive, filtered once per seed.
+
+    - Keeps text shapes containing the current_key token.
+    - Keeps shapes with no placeholder tokens in their text.
+    - Drops shapes that contain any other placeholder tokens.
+    - Drops shapes with image relationships to avoid missing rels/repair.
     """
-    seed = prs.slides[seed_index]
-    new_slide = prs.slides.add_slide(seed.slide_layout)
-    insert_slide_after(prs, new_slide, seed_index)
-    clear_shapes(new_slide)
+    other_tokens = known_tokens - {current_key}
+    if known_pattern is None:
+        known_pattern = token_pattern(known_tokens)
 
-    def should_copy(shape) -> bool:
-        if _shape_has_image_rel(shape):
+    def should_copy(txt: str, has_image: bool) -> bool:
+        if has_image:
             return False
-        txt = _shape_text(shape)
-        if current_key in txt:
+        if not txt:
+            return True
+        # one scan for every known token, then set checks
+        found = set(known_pattern.findall(txt))
+        if current_key in found:
             return True
-        if any(tok in txt for tok in known_tokens if tok != current_key):
+        if found & other_tokens:
             return False
         # copy everything else (title boxes, static labels, shapes without text)
         return True
 
-    for shape in seed.shapes:
-        if should_copy(shape):
-            new_el = deepcopy(shape._element)
-            new_slide.shapes._spTree.insert_element_before(new_el, 'p:extLst')
+    return [
+        shape._element
+        for shape, txt, has_image in seed_shape_meta(prs.slides[seed_index])
+        if should_copy(txt, has_image)
+    ]
+
+
+def duplicate_slide_filtered(
+    prs: Presentation,
+    seed_index: int,
+    current_key: str,
+    known_tokens: set[str],
+    template: Optional[List[object]] = None,
+    rid_by_part: Optional[Dict[object, str]] = None,
+) -> Tuple[int, object]:
+    """Duplicate a slide by copying only safe shapes to avoid repair prompts and stray placeholders.
+
+    The shapes copied are prepare_seed_template(); pass its result as
+    template to reuse one filtering pass across a run of duplicates (the copy
+    is still inserted right after seed_index). rid_by_part is passed to
+    insert_slide_after.
+    """
+    seed = prs.slides[seed_index]
+    if template is None:
+        template = prepare_seed_template(prs, seed_index, current_key, known_tokens)
+    new_slide = prs.slides.add_slide(seed.slide_layout)
+    insert_slide_after(prs, new_slide, seed_index, rid_by_part)
+    clear_shapes(new_slide)
+
+    sp_tree = new_slide.shapes._spTree
+    for el in template:
+        sp_tree.insert_element_before(_clone_element(el), 'p:extLst')
+    invalidate_shape_cache(new_slide)
 
     return seed_index + 1, new_slide
 
 
+# zlib level for the saved deck's zip members. The deck is written once and
+# opened right away, so the cheapest deflate level wins over a smaller file.
+SAVE_COMPRESSLEVEL = 1
+
+
+def save_presentation(prs: Presentation, path: str, compresslevel: Optional[int] = SAVE_COMPRESSLEVEL) -> None:
+    """prs.save(path), deflating each part at compresslevel (None keeps zlib's default).
+
+    python-pptx exposes no compression option, so its zip writer's write()
+    is swapped for the duration of the save only.
+    """
+    try:
+        from pptx.opc.serialized import _ZipPkgWriter
+    except ImportError:  # writer moved upstream; keep the stock behaviour
+        _ZipPkgWriter = None
+    if compresslevel is None or _ZipPkgWriter is None:
+        prs.save(path)
+        return
+
+    def write(self, pack_uri, blob: bytes) -> None:
+        self._zipf.writestr(pack_uri.membername, blob, compresslevel=compresslevel)
+
+    orig = _ZipPkgWriter.write
+    _ZipPkgWriter.write = write
+    try:
+        prs.save(path)
+    finally:
+        _ZipPkgWriter.write = orig
+
+
 def load_payload(json_path: str) -> Dict:
     with open(json_path, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
+# Psalm refrain line: "R." / "R/" / "R", optionally with a qualifier like "(7a)"
+_REFRAIN_RE = re.compile(r"^R[./]?(?:\s*\([^)]*\))?\s")
+# Any run of CR/LF: normalizes line endings and skips blank lines in one split
+_LINE_SPLIT = re.compile(r"[\r\n]+")
+
+
 def chunk_psalm_text(text: str) -> List[str]:
     """Split psalm into alternating refrain and verse blocks.
 
@@ -213,15 +458,12 @@ def chunk_psalm_text(text: str) -> List[str]:
     """
     if text is None:
         return []
-    lines = [ln.strip() for ln in text.replace("\r\n", "\n").replace("\r", "\n").split("\n")]
-    lines = [ln for ln in lines if ln]
+    lines = [ln for ln in map(str.strip, _LINE_SPLIT.split(text)) if ln]
     chunks: List[str] = []
     current_verse: List[str] = []
-    import re
-    is_refrain = lambda s: re.match(r"^R[\./]?(?:\s*\([^)]*\))?\s", s) is not None or s.startswith("R.")
 
     for ln in lines:
-        if is_refrain(ln):
+        if _REFRAIN_RE.match(ln) is not None or ln.startswith("R."):
             # Flush verse collected so far
             if current_verse:
                 verse = "\n".join(current_verse).strip()
@@ -269,11 +511,15 @@ def main() -> None:
     placeholders: Dict[str, str] = payload.get("placeholders", {})
     chunks_map: Dict[str, List[str]] = payload.get("chunks", {})
 
-    prs = Presentation(args.template)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        format="%(message)s",
+        stream=sys.stdout,
+    )
+    # Guards for debug output whose *arguments* are costly (token scans, previews)
+    debug = logger.isEnabledFor(logging.DEBUG)
 
-    def log(msg: str) -> None:
-        if args.verbose:
-            print(msg)
+    prs = Presentation(args.template)
 
     # Log initial positions of all placeholders before any replacement/deletion
     interested = [
@@ -283,12 +529,10 @@ def main() -> None:
         "{ACCLAMATION_REF}", "{ACCLAMATION_TXT}",
         "{GOSPEL_REF}", "{GOSPEL_TXT}",
     ]
-    if args.verbose:
-        for tok in interested:
-            idxs = find_seed_slide_indices(prs, tok)
-            if idxs:
-                log(f"Initial positions {tok}: {[i+1 for i in idxs]} (1-based)")
-
+    # For diagnostics: a superset including hymn placeholders
+    log_tokens = set(interested + [
+        "{ENTRANCE_HYMN}", "{OFFERTORY_HYMN}", "{MYSTERY_OF_FAITH}", "{COMMUNION_HYMN}", "{RECESSIONAL_HYMN}",
+    ])
     # Define which placeholders should use waterfall expansion
     waterfall_keys = [
         "{FIRST_READING_TXT}",
@@ -313,52 +557,42 @@ def main() -> None:
     for tok in known_tokens:
         if tok not in placeholders and tok not in waterfall_keys:
             simple_mapping[tok] = ""
+    simple_pattern = token_pattern(simple_mapping)
+    known_pattern = token_pattern(known_tokens)
 
-    # For diagnostics: a superset including hymn placeholders
-    log_tokens = set(interested + [
-        "{ENTRANCE_HYMN}", "{OFFERTORY_HYMN}", "{MYSTERY_OF_FAITH}", "{COMMUNION_HYMN}", "{RECESSIONAL_HYMN}",
-    ])
+    log_pattern = token_pattern(log_tokens)
 
     def tokens_in_slide(slide) -> List[str]:
-        present = []
-        for tok in log_tokens:
-            if slide_contains_token(slide, tok):
-                present.append(tok)
-        return sorted(present)
+        # one scan of the cached frame texts for all log tokens
+        return sorted(slide_tokens(slide, log_pattern))
 
     def slide_text_preview(slide, limit: int = 120) -> str:
         parts: List[str] = []
-        for shape in iter_shapes(slide):
-            if getattr(shape, 'has_text_frame', False):
-                t = shape.text_frame.text or ''
+        for _, frames, _ in slide_shape_entries(slide):
+            for tf in frames:
+                t = tf.text or ''
                 if t:
                     parts.append(t.replace('\n', '|'))
-            if getattr(shape, 'has_table', False):
-                for row in shape.table.rows:
-                    for cell in row.cells:
-                        ct = cell.text_frame.text or ''
-                        if ct:
-                            parts.append(ct.replace('\n', '|'))
         txt = ' || '.join(parts)
         if len(txt) > limit:
             return txt[:limit] + '...'
         return txt
 
+    def snapshot_slide(idx: int, slide, toks: List[str]) -> None:
+        if toks:
+            logger.debug("  slide %d: tokens=%s", idx, toks)
+        else:
+            # still show a short text preview to inspect blanks
+            prev = slide_text_preview(slide)
+            logger.debug("  slide %d: tokens=[], preview='%s'", idx, prev)
+
     def snapshot(label: str) -> None:
-        if not args.verbose:
+        if not debug:
             return
-        print(f"SNAP[{label}] total_slides={len(prs.slides)}")
-        for idx, slide in enumerate(prs.slides, start=1):
-            toks = tokens_in_slide(slide)
-            if toks:
-                print(f"  slide {idx}: tokens={toks}")
-            else:
-                # still show a short text preview to inspect blanks
-                prev = slide_text_preview(slide)
-                print(f"  slide {idx}: tokens=[], preview='{prev}'")
-
-    # Snapshot before any changes
-    snapshot('before')
+        slides = list(prs.slides)
+        logger.debug("SNAP[%s] total_slides=%d", label, len(slides))
+        for idx, slide in enumerate(slides, start=1):
+            snapshot_slide(idx, slide, tokens_in_slide(slide))
 
     # If there is no second reading, do NOT delete slides (can corrupt package);
     # instead, blank placeholders via simple_mapping cleanup below.
@@ -367,30 +601,49 @@ def main() -> None:
     has_second_reading = bool(sec_txt) or (isinstance(sec_chunks, list) and any((c or "").strip() for c in sec_chunks))
     # log status but keep slides
     if not has_second_reading:
-        log("No second reading detected; leaving slides in place and blanking placeholders.")
-
-    # 1) Replace simple placeholders across all slides
-    for slide in prs.slides:
-        replace_tokens_in_slide(slide, simple_mapping)
+        logger.debug("No second reading detected; leaving slides in place and blanking placeholders.")
+
+    # 1) Replace simple placeholders across all slides. The same walk records
+    # which tokens each slide held beforehand (seeds, initial positions) and
+    # prints the 'before' snapshot, so the deck is only traversed once here.
+    def before(i: int, slide, toks: Set[str]) -> None:
+        snapshot_slide(i + 1, slide, sorted(toks & log_tokens))
+
+    # Slide wrappers are rebuilt on every prs.slides access; materialize the
+    # list per phase and refresh it whenever the deck is mutated.
+    slides = list(prs.slides)
+    if debug:
+        logger.debug("SNAP[before] total_slides=%d", len(slides))
+    deck_index = process_deck_once(
+        slides, simple_mapping, simple_pattern,
+        token_pattern(log_tokens | set(waterfall_keys)),
+        before=before if debug else None,
+    )
+    if debug:
+        for tok in interested:
+            idxs = find_seed_slide_indices(prs, tok, deck_index)
+            if idxs:
+                logger.debug("Initial positions %s: %s (1-based)", tok, [i + 1 for i in idxs])
 
     # 2) Waterfall expansion for long body text
-    # Find seed indices first
+    # Seed indices come from the pre-replacement index
     seeds: List[Tuple[str, int]] = []
     for key in waterfall_keys:
-        indices = find_seed_slide_indices(prs, key)
+        indices = find_seed_slide_indices(prs, key, deck_index)
         if not indices:
             # No seed present for this key; fall back to replacing token as-is
             val = _sanitize_text(placeholders.get(key, ""))
-            log(f"No seed for {key}; applying simple replacement across deck")
-            for slide in prs.slides:
+            logger.debug("No seed for %s; applying simple replacement across deck", key)
+            for slide in slides:
                 replace_tokens_in_slide(slide, {key: val})
             continue
         # assume exactly one seed per key; use the first if multiple
         seed_idx = indices[0]
         seeds.append((key, seed_idx))
-        log(f"Seed for {key} at slide index {seed_idx}")
+        logger.debug("Seed for %s at slide index %d", key, seed_idx)
 
     # Process in descending order to avoid shifting indices of future seeds
+    rid_by_part = slide_rid_map(prs)
     seeds.sort(key=lambda kv: kv[1], reverse=True)
 
     # Process each seed in order
@@ -411,35 +664,45 @@ def main() -> None:
         # Enforce desired bounds for non-psalm waterfalls
         if key != "{PSALM_TXT}":
             chunks = enforce_chunk_bounds(chunks, min_chars=100, max_chars=140)
-        log(f"{key}: {len(chunks)} chunk(s)")
+        logger.debug("%s: %d chunk(s)", key, len(chunks))
 
         if len(chunks) == 0:
             continue
 
         # Duplicate slides for all chunks beyond the first
         # Strategy: create N-1 new slides right after the current tail of this sequence
-        log(f"{key}: seed slide {seed_index+1} tokens before dup: {tokens_in_slide(prs.slides[seed_index])}")
+        if debug:
+            logger.debug("%s: seed slide %d tokens before dup: %s",
+                         key, seed_index + 1, tokens_in_slide(slides[seed_index]))
         current_index = seed_index
         created_indices: List[int] = []
+        # Filter the seed's shapes once; every duplicate clones the same set.
+        # The seed already went through the simple pass, so clones need none.
+        template = prepare_seed_template(prs, seed_index, key, known_tokens, known_pattern)
         # Create N-1 duplicates of the seed, inserted sequentially after it
         for _ in range(len(chunks) - 1):
-            new_index, new_slide = duplicate_slide_filtered(prs, current_index, key, known_tokens)
-            # Fill simple placeholders on the newly created slide as well
-            replace_tokens_in_slide(new_slide, simple_mapping)
-            log(f"{key}: created slide {new_index+1} tokens after dup: {tokens_in_slide(new_slide)}")
+            new_index, new_slide = duplicate_slide_filtered(
+                prs, current_index, key, known_tokens, template, rid_by_part
+            )
+            if debug:
+                logger.debug("%s: created slide %d tokens after dup: %s",
+                             key, new_index + 1, tokens_in_slide(new_slide))
             created_indices.append(new_index)
             current_index = new_index
 
         # Now we have [seed_index] + created_indices as our sequence in order
         sequence_indices = [seed_index] + created_indices
-        log(f"{key}: sequence slide indices: {sequence_indices}")
+        logger.debug("%s: sequence slide indices: %s", key, sequence_indices)
 
         # Replace the body token with each chunk on seed + duplicates
+        if created_indices:
+            slides = list(prs.slides)
         for seq_i, chunk_text in zip(sequence_indices, chunks):
-            slide = prs.slides[seq_i]
+            slide = slides[seq_i]
             replace_tokens_in_slide(slide, {key: chunk_text})
-            preview = (chunk_text or "")[:80].replace('\n','|')
-            log(f"{key}: slide {seq_i+1} text set preview: {preview}...")
+            if debug:
+                preview = (chunk_text or "")[:80].replace('\n', '|')
+                logger.debug("%s: slide %d text set preview: %s...", key, seq_i + 1, preview)
 
     # Snapshot after all replacements and duplications
     snapshot('after')
@@ -462,7 +725,7 @@ def main() -> None:
 
     out_path = Path(out_path_str)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    prs.save(str(out_path))
+    save_presentation(prs, str(out_path))
     # Always print the final output path so users can find the newest
     print(f"Wrote: {out_path}")
 